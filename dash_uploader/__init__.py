@@ -13,6 +13,7 @@ from dash_uploader.uploadstatus import UploadStatus
 # noinspection PyUnresolvedReferences
 from ._build._imports_ import *  # noqa: F403,F401
 from ._build._imports_ import __all__ as build_all
+from ._build import _imports_ as _build_imports
 
 # Defines all exposed APIs of this package.
 __all__ = [
@@ -32,13 +33,20 @@ if not hasattr(_dash, "development"):
     )
     _sys.exit(1)
 
-_basepath = _os.path.dirname(__file__)
-_filepath = _os.path.abspath(_os.path.join(_basepath, "_build", "package-info.json"))
-with open(_filepath) as f:
-    package = json.load(f)
+try:
+    # Generated by devscripts/post_build.py
+    from ._build._package_info import package_name, __version__
+except ImportError:
+    # Builds made before _package_info.py was introduced.
+    _basepath = _os.path.dirname(__file__)
+    _filepath = _os.path.abspath(
+        _os.path.join(_basepath, "_build", "package-info.json")
+    )
+    with open(_filepath) as f:
+        package = json.load(f)
 
-package_name = package["name"].replace(" ", "_").replace("-", "_")
-__version__ = package["version"]
+    package_name = package["name"].replace(" ", "_").replace("-", "_")
+    __version__ = package["version"]
 
 _current_path = _os.path.dirname(_os.path.abspath(__file__))
 
@@ -52,8 +60,9 @@ _js_dist = [
     },
 ]
 
-_css_dist = []
+_css_dist = ()
 
 for _component in build_all:
-    setattr(locals()[_component], "_js_dist", _js_dist)
-    setattr(locals()[_component], "_css_dist", _css_dist)
+    _component_cls = getattr(_build_imports, _component)
+    _component_cls._js_dist = _js_dist
+    _component_cls._css_dist = _css_dist
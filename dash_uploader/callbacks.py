@@ -1,4 +1,4 @@
-from pathlib import Path
+import os
 
 from dash.exceptions import PreventUpdate
 from dash.dependencies import Input, State
@@ -22,19 +22,18 @@ def _create_dash_callback(callback, settings):  # pylint: disable=redefined-oute
         total_files_size,
         upload_id,
     ):
-        if not callbackbump:
+        # Nothing to report; UploadStatus needs at least one file.
+        if not callbackbump or not uploaded_filenames:
             raise PreventUpdate()
 
-        uploadedfilepaths = []
-        if uploaded_filenames is not None:
-            if upload_id:
-                root_folder = Path(settings.UPLOAD_FOLDER_ROOT) / upload_id
-            else:
-                root_folder = Path(settings.UPLOAD_FOLDER_ROOT)
+        if upload_id:
+            root_folder = os.path.join(settings.UPLOAD_FOLDER_ROOT, upload_id)
+        else:
+            root_folder = settings.UPLOAD_FOLDER_ROOT
 
-            for filename in uploaded_filenames:
-                file = root_folder / filename
-                uploadedfilepaths.append(str(file))
+        uploadedfilepaths = [
+            os.path.join(root_folder, filename) for filename in uploaded_filenames
+        ]
 
         status = UploadStatus(
             uploaded_files=uploadedfilepaths,
@@ -76,6 +75,16 @@ def callback(
 
     """
 
+    # The states depend only on `id`; build them once and share
+    # them between all the functions decorated with this callback.
+    states = [
+        State(id, "uploadedFileNames"),
+        State(id, "totalFilesCount"),
+        State(id, "uploadedFilesSize"),
+        State(id, "totalFilesSize"),
+        State(id, "upload_id"),
+    ]
+
     def add_callback(function):
         """
         Parameters
@@ -91,16 +100,16 @@ def callback(
             Output('callback-output', 'children')
 
         """
-        dash_callback = _create_dash_callback(
-            function,
-            settings,
-        )
-
         if not hasattr(settings, "app"):
             raise Exception(
                 "The du.configure_upload must be called before the @du.callback can be used! Please, configure the dash-uploader."
             )
 
+        dash_callback = _create_dash_callback(
+            function,
+            settings,
+        )
+
         kwargs = dict()
         if dash_version_is_at_least("1.12"):
             # See: https://github.com/plotly/dash/blob/dev/CHANGELOG.md  and
@@ -118,16 +127,7 @@ def callback(
         #
         # See also: https://dash.plotly.com/basic-callbacks
         dash_callback = settings.app.callback(
-            output,
-            [Input(id, "dashAppCallbackBump")],
-            [
-                State(id, "uploadedFileNames"),
-                State(id, "totalFilesCount"),
-                State(id, "uploadedFilesSize"),
-                State(id, "totalFilesSize"),
-                State(id, "upload_id"),
-            ],
-            **kwargs
+            output, [Input(id, "dashAppCallbackBump")], list(states), **kwargs
         )(dash_callback)
 
         return function
@@ -9,7 +9,11 @@ logger = logging.getLogger("dash_uploader")
 
 
 def configure_upload(
-    app, folder, use_upload_id=True, upload_api=None, http_request_handler=None
+    app,
+    folder,
+    use_upload_id=True,
+    upload_api=None,
+    http_request_handler=HttpRequestHandler,
 ):
     r"""
     Configure the upload APIs for dash app.
@@ -40,7 +44,8 @@ def configure_upload(
     http_request_handler: None or class
         Used for custom configuration on the Http POST and GET requests.
         This can be used to add validation for the HTTP requests (Important
-        if your site is public!). If None, dash_uploader.HttpRequestHandler is used.
+        if your site is public!). By default (or if None),
+        dash_uploader.HttpRequestHandler is used.
         If you provide a class, use a subclass of HttpRequestHandler.
         See the documentation of dash_uploader.HttpRequestHandler for
         more details.
@@ -57,11 +62,16 @@ def configure_upload(
         settings.upload_api = upload_api
 
     # Needed if using a proxy
-    settings.requests_pathname_prefix = app.config.get("requests_pathname_prefix", "/")
-    settings.routes_pathname_prefix = app.config.get("routes_pathname_prefix", "/")
+    config = app.config
+    settings.requests_pathname_prefix = config.get("requests_pathname_prefix", "/")
+    settings.routes_pathname_prefix = config.get("routes_pathname_prefix", "/")
+
+    # Resolve the front-end address once, instead of in every du.Upload.
+    settings.service = update_upload_api(settings.requests_pathname_prefix, upload_api)
 
     upload_api = update_upload_api(settings.routes_pathname_prefix, upload_api)
 
+    # Explicit None is still accepted for backwards compatibility.
     if http_request_handler is None:
         http_request_handler = HttpRequestHandler
 
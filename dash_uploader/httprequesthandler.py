@@ -32,18 +32,18 @@ class RequestData:
         request: flask.request
             The Flask request object
         """
+        # Resolve the request proxy only once.
+        form = request.form
         # Available fields: https://github.com/flowjs/flow.js
-        self.n_chunks_total = request.form.get("flowTotalChunks", type=int)
-        self.chunk_number = request.form.get("flowChunkNumber", default=1, type=int)
-        self.filename = request.form.get("flowFilename", default="error", type=str)
+        self.n_chunks_total = form.get("flowTotalChunks", type=int)
+        self.chunk_number = form.get("flowChunkNumber", default=1, type=int)
+        self.filename = form.get("flowFilename", default="error", type=str)
         # 'unique' identifier for the file that is being uploaded.
         # Made of the file size and file name (with relative path, if available)
-        self.unique_identifier = request.form.get(
-            "flowIdentifier", default="error", type=str
-        )
+        self.unique_identifier = form.get("flowIdentifier", default="error", type=str)
         # flowRelativePath is the flowFilename with the directory structure included
         # the path is relative to the chosen folder.
-        self.relative_path = request.form.get("flowRelativePath", default="", type=str)
+        self.relative_path = form.get("flowRelativePath", default="", type=str)
         if not self.relative_path:
             self.relative_path = self.filename
 
@@ -51,7 +51,7 @@ class RequestData:
         # Type of `chunk_data`: werkzeug.datastructures.FileStorage
         self.chunk_data = request.files["file"]
 
-        self.upload_id = request.form.get("upload_id", default="", type=str)
+        self.upload_id = form.get("upload_id", default="", type=str)
 
 
 class BaseHttpRequestHandler:
@@ -2,6 +2,11 @@
 # The du.configure_upload can change this
 upload_api = "/API/dash-uploader"
 
+# The upload api endpoint as seen by the front-end, with the
+# `requests_pathname_prefix` prepended.
+# The du.configure_upload updates this
+service = upload_api
+
 # Needed if using a proxy; when dash.Dash is used
 # with a `requests_pathname_prefix`.
 # The front-end will prefix this string to the requests
@@ -1,19 +1,24 @@
+from types import MappingProxyType
 import uuid
 
 from dash_uploader._build.Upload_ReactComponent import Upload_ReactComponent
 import dash_uploader.settings as settings
 
-DEFAULT_STYLE = {
-    "width": "100%",
-    # min-height and line-height should be the same to make
-    # the centering work.
-    "minHeight": "100px",
-    "lineHeight": "100px",
-    "textAlign": "center",
-    "borderWidth": "1px",
-    "borderStyle": "dashed",
-    "borderRadius": "7px",
-}
+# Read-only, so that it cannot be modified accidentally
+# and leak to all of the du.Upload components.
+DEFAULT_STYLE = MappingProxyType(
+    {
+        "width": "100%",
+        # min-height and line-height should be the same to make
+        # the centering work.
+        "minHeight": "100px",
+        "lineHeight": "100px",
+        "textAlign": "center",
+        "borderWidth": "1px",
+        "borderStyle": "dashed",
+        "borderRadius": "7px",
+    }
+)
 
 
 def update_upload_api(requests_pathname_prefix, upload_api):
@@ -22,21 +27,28 @@ def update_upload_api(requests_pathname_prefix, upload_api):
     """
     if requests_pathname_prefix == "/":
         return upload_api
-    return "/".join(
-        [
-            requests_pathname_prefix.rstrip("/"),
-            upload_api.lstrip("/"),
-        ]
-    )
+    return f"{requests_pathname_prefix.rstrip('/')}/{upload_api.lstrip('/')}"
 
 
-def combine(overiding_dict, base_dict):
+# Marks an omitted argument.
+_MISSING = object()
+
+
+def combine(base_dict, overriding_dict=_MISSING):
     """Combining two dictionaries without modifying them.
+    If `overriding_dict` is omitted, returns a copy of `base_dict`.
     This is a private method, and should not be exposed to users.
     """
-    if overiding_dict is None:
+    if overriding_dict is _MISSING:
         return dict(base_dict)
-    return {**base_dict, **overiding_dict}
+    return {**base_dict, **overriding_dict}
+
+
+# The styles used when no `default_style` is given.
+# Upload() hands out copies, since the component props must be
+# plain dicts that the components do not share.
+_DISABLED_STYLE = MappingProxyType(combine(DEFAULT_STYLE, {"opacity": "0.5"}))
+_UPLOADING_STYLE = MappingProxyType(combine(DEFAULT_STYLE, {"lineHeight": "0px"}))
 
 
 # Implemented as function, but still uppercase.
@@ -136,41 +148,44 @@ def Upload(
     """
 
     # Handle styling
-    default_style = combine(default_style, DEFAULT_STYLE)
-    disabled_style = combine({"opacity": "0.5"}, default_style)
-    upload_style = combine({"lineHeight": "0px"}, default_style)
+    if default_style is None:
+        default_style = combine(DEFAULT_STYLE)
+        disabled_style = combine(_DISABLED_STYLE)
+        upload_style = combine(_UPLOADING_STYLE)
+    else:
+        default_style = combine(DEFAULT_STYLE, default_style)
+        disabled_style = combine(default_style, {"opacity": "0.5"})
+        upload_style = combine(default_style, {"lineHeight": "0px"})
 
     if upload_id is None:
         upload_id = uuid.uuid1()
 
-    service = update_upload_api(settings.requests_pathname_prefix, settings.upload_api)
-
-    arguments = dict(
-        id=id,
-        dashAppCallbackBump=0,
+    arguments = {
+        "id": id,
+        "dashAppCallbackBump": 0,
         # Have not tested if using many files
         # is reliable -> Do not allow
-        maxFiles=max_files,
-        maxTotalSize=max_total_size * 1024 * 1024,
-        maxFileSize=max_file_size * 1024 * 1024,
-        chunkSize=chunk_size * 1024 * 1024,
-        text=text,
-        service=service,
-        startButton=False,
-        disabled=disabled,
+        "maxFiles": max_files,
+        "maxTotalSize": max_total_size * 1024 * 1024,
+        "maxFileSize": max_file_size * 1024 * 1024,
+        "chunkSize": chunk_size * 1024 * 1024,
+        "text": text,
+        "service": settings.service,
+        "startButton": False,
+        "disabled": disabled,
         # Not tested so default to one.
-        simultaneousUploads=1,
-        completedMessage=text_completed,
-        disabledMessage=text_disabled,
-        cancelButton=cancel_button,
-        pauseButton=pause_button,
-        defaultStyle=default_style,
-        disabledStyle=disabled_style,
-        uploadingStyle=upload_style,
-        completeStyle=default_style,
-        upload_id=str(upload_id),
-        totalFilesCount=0,
-    )
+        "simultaneousUploads": 1,
+        "completedMessage": text_completed,
+        "disabledMessage": text_disabled,
+        "cancelButton": cancel_button,
+        "pauseButton": pause_button,
+        "defaultStyle": default_style,
+        "disabledStyle": disabled_style,
+        "uploadingStyle": upload_style,
+        "completeStyle": default_style,
+        "upload_id": str(upload_id),
+        "totalFilesCount": 0,
+    }
 
     if filetypes:
         arguments["filetypes"] = filetypes
@@ -1,14 +1,31 @@
+import functools
+import importlib.metadata
+import itertools
 import logging
 from typing import final
 from packaging import version
-import pkg_resources
 import time
 
+
 ## Dash version
-dash_version_str = pkg_resources.get_distribution("dash").version
-dash_version = version.parse(dash_version_str)
+# Looked up on first use, so that importing this module does not
+# need to scan the installed package metadata.
+@functools.lru_cache(maxsize=None)
+def _get_dash_version():
+    dash_version_str = importlib.metadata.version("dash")
+    return dash_version_str, version.parse(dash_version_str)
+
+
+def __getattr__(name):
+    # Lazy module attributes `dash_version_str` and `dash_version` (PEP 562).
+    if name == "dash_version_str":
+        return _get_dash_version()[0]
+    if name == "dash_version":
+        return _get_dash_version()[1]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
+@functools.lru_cache(maxsize=None)
 def dash_version_is_at_least(req_version="1.12"):
     """Check that the used version of dash is greater or equal
     to some version `req_version`.
@@ -16,8 +33,10 @@ def dash_version_is_at_least(req_version="1.12"):
     Will return True if current dash version is greater than
     the argument "req_version".
     This is a private method, and should not be exposed to users.
+    The result is cached, since the dash version does not change
+    at runtime.
     """
-    return dash_version >= version.parse(req_version)
+    return _get_dash_version()[1] >= version.parse(req_version)
 
 
 def retry(wait_time, max_time):
@@ -27,33 +46,32 @@ def retry(wait_time, max_time):
     Parameters
     ----------
     wait_time: numeric
-        The wait time in seconds between trials
+        The initial wait time in seconds between trials.
+        Doubled after every failed trial, up to 8 * wait_time.
     max_time: numeric
         Maximum time to wait
     """
 
     def add_callback(function):
         def wrapper(*args, **kwargs):
-            t0 = time.time()
-            i = 1
-            while True:
+            # Monotonic clock: not affected by system clock adjustments.
+            t0 = time.monotonic()
+            deadline = t0 + max_time
+            for i in itertools.count(1):
+                if i > 1:
+                    logging.warning(
+                        f"Trying to call function '{function.__name__}'! Trial #{i}."
+                        + f" Used time: {time.monotonic() - t0:.2f}s"
+                    )
                 try:
-                    if i > 1:
-                        logtxt = (
-                            f"Trying to call function '{function.__name__}'! Trial #{i}."
-                            + f" Used time: {time.time() - t0:.2}s",
-                        )
-                        logging.warning(logtxt)
-                    out = function(*args, **kwargs)
-                    break
-                except Exception as e:
-                    if time.time() - t0 > max_time:
-                        raise e
-                    else:
-                        time.sleep(wait_time)
-                finally:
-                    i += 1
-            return out
+                    return function(*args, **kwargs)
+                except Exception:
+                    now = time.monotonic()
+                    if now >= deadline:
+                        raise
+                    # Exponential backoff, capped at 8 * wait_time
+                    # and at the time left before the deadline.
+                    time.sleep(min(wait_time * (1 << min(i - 1, 3)), deadline - now))
 
         return wrapper
 
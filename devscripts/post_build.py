@@ -1,3 +1,4 @@
+import json
 from pathlib import Path
 import shutil
 
@@ -18,3 +19,17 @@ for filename in filenames:
     shutil.move(folder_from / filename, folder_to / filename)
 
 Path(folder_to / "__init__.py").touch(exist_ok=True)
+
+# Bake the package name and version into a module, so that importing
+# dash_uploader does not need to parse package-info.json.
+with open(folder_to / "package-info.json") as f:
+    package = json.load(f)
+
+package_name = package["name"].replace(" ", "_").replace("-", "_")
+
+with open(folder_to / "_package_info.py", "w") as f:
+    f.write(
+        "# AUTO GENERATED FILE - DO NOT EDIT\n\n"
+        f"package_name = {json.dumps(package_name)}\n"
+        f"__version__ = {json.dumps(package['version'])}\n"
+    )
@@ -0,0 +1,33 @@
+import pytest
+
+from dash_uploader import utils
+
+
+def test_retry_backoff_and_timeout(monkeypatch):
+
+    # Fake clock: only time.sleep moves the time forward.
+    now = [0.0]
+    sleeps = []
+
+    def fake_sleep(seconds):
+        sleeps.append(seconds)
+        now[0] += seconds
+
+    monkeypatch.setattr(utils.time, "monotonic", lambda: now[0])
+    monkeypatch.setattr(utils.time, "sleep", fake_sleep)
+
+    calls = []
+
+    @utils.retry(wait_time=1, max_time=20)
+    def always_fails():
+        calls.append(now[0])
+        raise OSError("still failing")
+
+    with pytest.raises(OSError, match="still failing"):
+        always_fails()
+
+    # The wait doubles after every trial, up to 8 * wait_time, and
+    # the last sleep is clamped to the time left before max_time.
+    assert sleeps == [1, 2, 4, 8, 5]
+    # The last trial is made at max_time and its error is re-raised.
+    assert calls == [0, 1, 3, 7, 15, 20]
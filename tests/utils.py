@@ -1,3 +1,5 @@
+import os
+
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 
@@ -27,7 +29,7 @@ def expect_alert(driver, text, timeout=4):
     alert.accept()
 
 
-def create_file(filename, filesize_mb=1):
+def create_file(filename, filesize_mb=1, dense=False):
     """
     Create file for testing purposes.
 
@@ -37,10 +39,23 @@ def create_file(filename, filesize_mb=1):
         The filename
     filesize_mb: numeric
         The file size in Mb.
+    dense: bool
+        If False, the file is only resized, which creates
+        a sparse file where supported. If True, the zeros
+        are actually written to the disk.
     """
-    with open(filename, "wb") as f:
-        f.seek(int(1024 * 1024 * filesize_mb))
-        f.write(b"0")
+    size = int(1024 * 1024 * filesize_mb)
+    # Same permissions as open(filename, "wb"); the default would be 0o777.
+    fd = os.open(filename, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+    try:
+        if not dense:
+            os.ftruncate(fd, size)
+            return
+        block = bytes(1024 * 1024)
+        while size > 0:
+            size -= os.write(fd, block[:size])
+    finally:
+        os.close(fd)
 
 
 def load_text_file(file_path):